@@ -446,9 +446,10 @@ def _compute_facecolors_matplotlib(bg_map, faces, n_vertices,
     This function computes the facecolors.
     """
     if bg_map is None:
-        bg_data = np.ones(n_vertices) * 0.5
+        bg_data = np.full(n_vertices, 0.5)
     else:
-        bg_data = np.copy(load_surf_data(bg_map))
+        # no copy needed: bg_data is only read to compute bg_faces
+        bg_data = load_surf_data(bg_map)
         if bg_data.shape[0] != n_vertices:
             raise ValueError('The bg_map does not have the same number '
                              'of vertices as the mesh.')
@@ -476,7 +477,7 @@ def _compute_facecolors_matplotlib(bg_map, faces, n_vertices,
     if alpha == 'auto':
         alpha = .5 if bg_map is None else 1
     # modify alpha values of background
-    face_colors[:, 3] = alpha * face_colors[:, 3]
+    face_colors[:, 3] *= alpha
 
     return face_colors
 
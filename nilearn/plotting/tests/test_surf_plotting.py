@@ -1,8 +1,11 @@
 # Tests for functions in surf_plotting.py
+import io
+import itertools
 import re
 import tempfile
 import unittest.mock as mock
 
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
@@ -10,13 +13,20 @@ from matplotlib.figure import Figure
 from numpy.testing import assert_array_equal
 
 from nilearn._utils.helpers import is_kaleido_installed, is_plotly_installed
-from nilearn.conftest import _rng
+from nilearn.conftest import _img_3d_mni, _rng
 from nilearn.datasets import fetch_surf_fsaverage
-from nilearn.plotting.displays import PlotlySurfaceFigure
+from nilearn.image import get_data
+from nilearn.plotting.displays import PlotlySurfaceFigure, SurfaceFigure
 from nilearn.plotting.surf_plotting import (
     VALID_HEMISPHERES,
     VALID_VIEWS,
+    _check_hemisphere_is_valid,
+    _check_view_is_valid,
     _compute_facecolors_matplotlib,
+    _configure_title_plotly,
+    _get_bounds,
+    _get_camera_view_from_elevation_and_azimut,
+    _get_camera_view_from_string_view,
     _get_ticks_matplotlib,
     _get_view_plot_surf_matplotlib,
     _get_view_plot_surf_plotly,
@@ -26,7 +36,7 @@ from nilearn.plotting.surf_plotting import (
     plot_surf_roi,
     plot_surf_stat_map,
 )
-from nilearn.surface import load_surf_data, load_surf_mesh
+from nilearn.surface import load_surf_data, load_surf_mesh, vol_to_surf
 from nilearn.surface.tests._testing import generate_surf
 
 try:
@@ -36,138 +46,65 @@ except ImportError:
 else:
     IPYTHON_INSTALLED = True
 
+try:
+    import plotly.graph_objects as go
+except ImportError:
+    go = None
+
+PLOTLY_INSTALLED = is_plotly_installed()
+KALEIDO_INSTALLED = is_kaleido_installed()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fast_rendering():
+    """Disable anti-aliasing and automatic layout while drawing.
+
+    No test in this module compares pixel values, so this only makes
+    drawing the figures cheaper.
+    The Agg backend is already selected in nilearn/conftest.py.
+    """
+    with mpl.rc_context({
+        "figure.autolayout": False,
+        "lines.antialiased": False,
+        "patch.antialiased": False,
+        "path.simplify": True,
+        "path.simplify_threshold": 1.0,
+        "text.antialiased": False,
+    }):
+        yield
+
+
+def _expected_camera_plotly(eye_axis, eye_sign, up_axis, up_sign):
+    """Build the plotly camera looking along ``eye_axis`` with ``up_axis`` \
+    pointing upwards."""
+    axes = ("x", "y", "z")
+    return {
+        "eye": {a: 1.5 * eye_sign if a == eye_axis else 0 for a in axes},
+        "up": {a: up_sign if a == up_axis else 0 for a in axes},
+        "center": {a: 0 for a in axes},
+    }
+
+
+# hemi, view, (elev, azim), eye axis and sign, up axis and sign
+_CAMERAS_PLOTLY_TABLE = [
+    ("left", "lateral", (0, 180), "x", -1, "z", 1),
+    ("left", "medial", (0, 0), "x", 1, "z", 1),
+    ("left", "dorsal", (90, 0), "z", 1, "x", -1),
+    ("left", "ventral", (270, 0), "z", -1, "x", 1),
+    ("left", "anterior", (0, 90), "y", 1, "z", 1),
+    ("left", "posterior", (0, 270), "y", -1, "z", 1),
+    ("right", "lateral", (0, 0), "x", 1, "z", 1),
+    ("right", "medial", (0, 180), "x", -1, "z", 1),
+    ("right", "dorsal", (90, 0), "z", 1, "x", -1),
+    ("right", "ventral", (270, 0), "z", -1, "x", 1),
+    ("right", "anterior", (0, 90), "y", 1, "z", 1),
+    ("right", "posterior", (0, 270), "y", -1, "z", 1),
+]
+
 
 EXPECTED_CAMERAS_PLOTLY = [
-    (
-        "left",
-        "lateral",
-        (0, 180),
-        {
-            "eye": {"x": -1.5, "y": 0, "z": 0},
-            "up": {"x": 0, "y": 0, "z": 1},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    (
-        "left",
-        "medial",
-        (0, 0),
-        {
-            "eye": {"x": 1.5, "y": 0, "z": 0},
-            "up": {"x": 0, "y": 0, "z": 1},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Dorsal left
-    (
-        "left",
-        "dorsal",
-        (90, 0),
-        {
-            "eye": {"x": 0, "y": 0, "z": 1.5},
-            "up": {"x": -1, "y": 0, "z": 0},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Ventral left
-    (
-        "left",
-        "ventral",
-        (270, 0),
-        {
-            "eye": {"x": 0, "y": 0, "z": -1.5},
-            "up": {"x": 1, "y": 0, "z": 0},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Anterior left
-    (
-        "left",
-        "anterior",
-        (0, 90),
-        {
-            "eye": {"x": 0, "y": 1.5, "z": 0},
-            "up": {"x": 0, "y": 0, "z": 1},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Posterior left
-    (
-        "left",
-        "posterior",
-        (0, 270),
-        {
-            "eye": {"x": 0, "y": -1.5, "z": 0},
-            "up": {"x": 0, "y": 0, "z": 1},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Lateral right
-    (
-        "right",
-        "lateral",
-        (0, 0),
-        {
-            "eye": {"x": 1.5, "y": 0, "z": 0},
-            "up": {"x": 0, "y": 0, "z": 1},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Medial right
-    (
-        "right",
-        "medial",
-        (0, 180),
-        {
-            "eye": {"x": -1.5, "y": 0, "z": 0},
-            "up": {"x": 0, "y": 0, "z": 1},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Dorsal right
-    (
-        "right",
-        "dorsal",
-        (90, 0),
-        {
-            "eye": {"x": 0, "y": 0, "z": 1.5},
-            "up": {"x": -1, "y": 0, "z": 0},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Ventral right
-    (
-        "right",
-        "ventral",
-        (270, 0),
-        {
-            "eye": {"x": 0, "y": 0, "z": -1.5},
-            "up": {"x": 1, "y": 0, "z": 0},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Anterior right
-    (
-        "right",
-        "anterior",
-        (0, 90),
-        {
-            "eye": {"x": 0, "y": 1.5, "z": 0},
-            "up": {"x": 0, "y": 0, "z": 1},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
-    # Posterior right
-    (
-        "right",
-        "posterior",
-        (0, 270),
-        {
-            "eye": {"x": 0, "y": -1.5, "z": 0},
-            "up": {"x": 0, "y": 0, "z": 1},
-            "center": {"x": 0, "y": 0, "z": 0},
-        },
-    ),
+    (hemi, view, elev_azim, _expected_camera_plotly(*camera))
+    for hemi, view, elev_azim, *camera in _CAMERAS_PLOTLY_TABLE
 ]
 
 
@@ -187,51 +124,34 @@ EXPECTED_VIEW_MATPLOTLIB = {"left": {"anterior": (0, 90),
 
 @pytest.mark.parametrize("full_view", EXPECTED_CAMERAS_PLOTLY)
 def test_get_view_plot_surf_plotly(full_view):
-    from nilearn.plotting.surf_plotting import (
-        _get_camera_view_from_elevation_and_azimut,
-        _get_camera_view_from_string_view,
-        _get_view_plot_surf_plotly,
-    )
     hemi, view_name, (elev, azim), expected_camera_view = full_view
     camera_view = _get_view_plot_surf_plotly(hemi, view_name)
     camera_view_string = _get_camera_view_from_string_view(hemi, view_name)
     camera_view_elev_azim = _get_camera_view_from_elevation_and_azimut(
         (elev, azim)
     )
-    # Check each camera view parameter
+    # Check each camera view parameter of the default camera view,
+    # the one obtained from string view and the one obtained
+    # from elevation & azimut
     for k in ["center", "eye", "up"]:
-        # Check default camera view
-        assert np.allclose(
-            list(camera_view[k].values()),
-            list(expected_camera_view[k].values())
-        )
-        # Check camera view obtained from string view
-        assert np.allclose(
-            list(camera_view_string[k].values()),
-            list(expected_camera_view[k].values())
-        )
-        # Check camera view obtained from elevation & azimut
-        assert np.allclose(
-            list(camera_view_elev_azim[k].values()),
-            list(expected_camera_view[k].values())
-        )
-
-
-@pytest.fixture
-def expected_view_matplotlib(hemi, view):
-    return EXPECTED_VIEW_MATPLOTLIB[hemi][view]
+        expected = np.fromiter(expected_camera_view[k].values(), dtype=float)
+        for camera in (camera_view, camera_view_string, camera_view_elev_azim):
+            assert np.allclose(
+                np.fromiter(camera[k].values(), dtype=float), expected
+            )
 
 
-@pytest.mark.parametrize("hemi", VALID_HEMISPHERES)
-@pytest.mark.parametrize("view", VALID_VIEWS)
-def test_get_view_plot_surf_matplotlib(hemi, view, expected_view_matplotlib):
-    from nilearn.plotting.surf_plotting import _get_view_plot_surf_matplotlib
-    assert (_get_view_plot_surf_matplotlib(hemi, view)
-            == expected_view_matplotlib)
+def test_get_view_plot_surf_matplotlib():
+    # Pure lookups: check all hemisphere / view combinations in one test
+    assert set(EXPECTED_VIEW_MATPLOTLIB) == set(VALID_HEMISPHERES)
+    for hemi, expected_views in EXPECTED_VIEW_MATPLOTLIB.items():
+        assert set(expected_views) == set(VALID_VIEWS)
+        for view, expected_view in expected_views.items():
+            assert (_get_view_plot_surf_matplotlib(hemi, view)
+                    == expected_view)
 
 
 def test_surface_figure():
-    from nilearn.plotting.displays import SurfaceFigure
     s = SurfaceFigure()
     assert s.output_file is None
     assert s.figure is None
@@ -245,7 +165,7 @@ def test_surface_figure():
     assert s.output_file == "bar.png"
 
 
-@pytest.mark.skipif(is_plotly_installed(),
+@pytest.mark.skipif(PLOTLY_INSTALLED,
                     reason='Plotly is installed.')
 def test_plotly_surface_figure_import_error():
     """Test that an ImportError is raised when instantiating \
@@ -254,7 +174,7 @@ def test_plotly_surface_figure_import_error():
         PlotlySurfaceFigure()
 
 
-@pytest.mark.skipif(not is_plotly_installed() or is_kaleido_installed(),
+@pytest.mark.skipif(not PLOTLY_INSTALLED or KALEIDO_INSTALLED,
                     reason=("This test only runs if Plotly is "
                             "installed, but not kaleido."))
 def test_plotly_surface_figure_savefig_error():
@@ -264,7 +184,7 @@ def test_plotly_surface_figure_savefig_error():
         PlotlySurfaceFigure().savefig()
 
 
-@pytest.mark.skipif(not is_plotly_installed() or not is_kaleido_installed(),
+@pytest.mark.skipif(not PLOTLY_INSTALLED or not KALEIDO_INSTALLED,
                     reason=("Plotly and/or kaleido not installed; "
                             "required for this test."))
 def test_plotly_surface_figure():
@@ -277,13 +197,22 @@ def test_plotly_surface_figure():
     ps.savefig('foo.png')
 
 
-@pytest.mark.skipif(not is_plotly_installed() or not IPYTHON_INSTALLED,
+@pytest.fixture(scope="module")
+def plotly_surface_fig():
+    """Return a PlotlySurfaceFigure wrapping an empty plotly figure.
+
+    Building plotly figures is slow, so this is shared by the tests
+    that do not modify the figure.
+    """
+    return PlotlySurfaceFigure(go.Figure())
+
+
+@pytest.mark.skipif(not PLOTLY_INSTALLED or not IPYTHON_INSTALLED,
                     reason=("Plotly and/or Ipython is not installed; "
                             "required for this test."))
 @pytest.mark.parametrize("renderer", ['png', 'jpeg', 'svg'])
-def test_plotly_show(renderer):
-    import plotly.graph_objects as go
-    ps = PlotlySurfaceFigure(go.Figure())
+def test_plotly_show(renderer, plotly_surface_fig):
+    ps = plotly_surface_fig
     assert ps.output_file is None
     assert ps.figure is not None
     with mock.patch("IPython.display.display") as mock_display:
@@ -293,11 +222,10 @@ def test_plotly_show(renderer):
     assert f'image/{key}' in mock_display.call_args.args[0]
 
 
-@pytest.mark.skipif(not is_plotly_installed() or not is_kaleido_installed(),
+@pytest.mark.skipif(not PLOTLY_INSTALLED or not KALEIDO_INSTALLED,
                     reason=("Plotly and/or kaleido not installed; "
                             "required for this test."))
 def test_plotly_savefig(tmp_path):
-    import plotly.graph_objects as go
     ps = PlotlySurfaceFigure(go.Figure(), output_file=tmp_path / "foo.png")
     assert ps.output_file == tmp_path / "foo.png"
     assert ps.figure is not None
@@ -305,7 +233,7 @@ def test_plotly_savefig(tmp_path):
     assert (tmp_path / "foo.png").exists()
 
 
-@pytest.mark.skipif(not is_plotly_installed(),
+@pytest.mark.skipif(not PLOTLY_INSTALLED,
                     reason='Plotly is not installed; required for this test.')
 @pytest.mark.parametrize("input_obj", ["foo", Figure(), ["foo", "bar"]])
 def test_instantiation_error_plotly_surface_figure(input_obj):
@@ -329,7 +257,6 @@ def test_instantiation_error_plotly_surface_figure(input_obj):
     ]
 )
 def test_check_view_is_valid(view, is_valid):
-    from nilearn.plotting.surf_plotting import _check_view_is_valid
     assert _check_view_is_valid(view) is is_valid
 
 
@@ -342,16 +269,11 @@ def test_check_view_is_valid(view, is_valid):
     ]
 )
 def test_check_hemisphere_is_valid(hemi, is_valid):
-    from nilearn.plotting.surf_plotting import _check_hemisphere_is_valid
     assert _check_hemisphere_is_valid(hemi) is is_valid
 
 
 @pytest.mark.parametrize("hemi,view", [("foo", "medial"), ("bar", "anterior")])
 def test_get_view_plot_surf_hemisphere_errors(hemi, view):
-    from nilearn.plotting.surf_plotting import (
-        _get_view_plot_surf_matplotlib,
-        _get_view_plot_surf_plotly,
-    )
     with pytest.raises(ValueError,
                        match="Invalid hemispheres definition"):
         _get_view_plot_surf_matplotlib(hemi, view)
@@ -374,7 +296,6 @@ def test_get_view_plot_surf_view_errors(hemi, view, f):
 
 
 def test_configure_title_plotly():
-    from nilearn.plotting.surf_plotting import _configure_title_plotly
     assert _configure_title_plotly(None, None) == dict()
     assert _configure_title_plotly(None, 22) == dict()
     config = _configure_title_plotly("Test Title", 22, color="green")
@@ -391,26 +312,52 @@ def test_configure_title_plotly():
                          [(np.linspace(0, 1, 100), (0, 1)),
                           (np.linspace(-.7, -.01, 40), (-.7, -.01))])
 def test_get_bounds(data, expected):
-    from nilearn.plotting.surf_plotting import _get_bounds
     assert _get_bounds(data) == expected
     assert _get_bounds(data, vmin=.2) == (.2, expected[1])
     assert _get_bounds(data, vmax=.8) == (expected[0], .8)
     assert _get_bounds(data, vmin=.1, vmax=.8) == (.1, .8)
 
 
-def test_plot_surf_engine_error():
+@pytest.fixture(scope="session")
+def surf_mesh():
+    """Return a read-only mesh shared by all tests of this module."""
     mesh = generate_surf()
+    for array in mesh:
+        array.setflags(write=False)
+    return mesh
+
+
+@pytest.fixture(scope="session")
+def surf_bg(surf_mesh):
+    """Return a read-only random background map matching ``surf_mesh``."""
+    bg = _rng().standard_normal(size=surf_mesh[0].shape[0], dtype=np.float32)
+    bg.setflags(write=False)
+    return bg
+
+
+@pytest.fixture(scope="session")
+def surf_stat_map(surf_mesh):
+    """Return a read-only random stat map matching ``surf_mesh``."""
+    data = _rng(seed=0).standard_normal(
+        size=surf_mesh[0].shape[0], dtype=np.float32
+    )
+    data *= 10
+    data.setflags(write=False)
+    return data
+
+
+def test_plot_surf_engine_error(surf_mesh):
+    mesh = surf_mesh
     with pytest.raises(ValueError,
                        match="Unknown plotting engine"):
         plot_surf(mesh, engine="foo")
 
 
 @pytest.mark.parametrize("engine", ["matplotlib", "plotly"])
-def test_plot_surf(engine, tmp_path, rng):
-    if not is_plotly_installed() and engine == "plotly":
+def test_plot_surf(engine, tmp_path, surf_mesh, surf_bg):
+    if not PLOTLY_INSTALLED and engine == "plotly":
         pytest.skip('Plotly is not installed; required for this test.')
-    mesh = generate_surf()
-    bg = rng.standard_normal(size=mesh[0].shape[0])
+    mesh, bg = surf_mesh, surf_bg
 
     # Plot mesh only
     plot_surf(mesh, engine=engine)
@@ -431,7 +378,7 @@ def test_plot_surf(engine, tmp_path, rng):
     plot_surf(mesh, bg_map=bg, colorbar=True, cbar_vmin=0,
               cbar_vmax=150, cbar_tick_format="%i", engine=engine)
     # Save execution time and memory
-    plt.close()
+    plt.close("all")
 
     # Plot with title
     display = plot_surf(mesh, bg_map=bg, title='Test title',
@@ -441,31 +388,32 @@ def test_plot_surf(engine, tmp_path, rng):
         assert display.axes[0].title._text == 'Test title'
 
 
-def test_plot_surf_avg_method(rng):
-    mesh = generate_surf()
+def test_plot_surf_avg_method(rng, surf_mesh):
+    mesh = surf_mesh
     # Plot with avg_method
     # Test all built-in methods and check
     mapp = rng.standard_normal(size=mesh[0].shape[0])
     mesh_ = load_surf_mesh(mesh)
     _, faces = mesh_[0], mesh_[1]
-
-    for method in ['mean', 'median', 'min', 'max']:
+    # Values of the map at the vertices of each face
+    mapp_faces = mapp[faces]
+    aggregations = {
+        'mean': np.mean,
+        'median': np.median,
+        'min': np.min,
+        'max': np.max,
+    }
+    cmap = plt.get_cmap(plt.rcParamsDefault['image.cmap'])
+
+    for method, aggregate in aggregations.items():
         display = plot_surf(mesh, surf_map=mapp,
                             avg_method=method,
                             engine='matplotlib')
-        if method == 'mean':
-            agg_faces = np.mean(mapp[faces], axis=1)
-        elif method == 'median':
-            agg_faces = np.median(mapp[faces], axis=1)
-        elif method == 'min':
-            agg_faces = np.min(mapp[faces], axis=1)
-        elif method == 'max':
-            agg_faces = np.max(mapp[faces], axis=1)
+        agg_faces = aggregate(mapp_faces, axis=1)
         vmin = np.min(agg_faces)
-        vmax = np.max(agg_faces)
-        agg_faces -= vmin
-        agg_faces /= (vmax - vmin)
-        cmap = plt.get_cmap(plt.rcParamsDefault['image.cmap'])
+        span = np.max(agg_faces) - vmin
+        np.subtract(agg_faces, vmin, out=agg_faces)
+        np.divide(agg_faces, span, out=agg_faces)
         assert_array_equal(
             cmap(agg_faces),
             display._axstack.as_list()[0].collections[0]._facecolors
@@ -480,15 +428,13 @@ def test_plot_surf_avg_method(rng):
         avg_method=custom_avg_function,
         engine='matplotlib',
     )
-    # Save execution time and memory
-    plt.close()
 
 
 @pytest.mark.parametrize("engine", ["matplotlib", "plotly"])
-def test_plot_surf_error(engine, rng):
-    if not is_plotly_installed() and engine == "plotly":
+def test_plot_surf_error(engine, rng, surf_mesh):
+    if not PLOTLY_INSTALLED and engine == "plotly":
         pytest.skip('Plotly is not installed; required for this test.')
-    mesh = generate_surf()
+    mesh = surf_mesh
 
     # Wrong inputs for view or hemi
     with pytest.raises(ValueError, match='Invalid view definition'):
@@ -501,7 +447,8 @@ def test_plot_surf_error(engine, rng):
             ValueError,
             match='bg_map does not have the same number of vertices'):
         plot_surf(mesh,
-                  bg_map=rng.standard_normal(size=mesh[0].shape[0] - 1),
+                  bg_map=rng.standard_normal(size=mesh[0].shape[0] - 1,
+                                             dtype=np.float32),
                   engine=engine
                   )
 
@@ -511,7 +458,9 @@ def test_plot_surf_error(engine, rng):
     ):
         plot_surf(
             mesh,
-            surf_map=rng.standard_normal(size=mesh[0].shape[0] + 1),
+            surf_map=rng.standard_normal(
+                size=mesh[0].shape[0] + 1, dtype=np.float32
+            ),
             engine=engine
         )
 
@@ -520,13 +469,15 @@ def test_plot_surf_error(engine, rng):
     ):
         plot_surf(
             mesh,
-            surf_map=rng.standard_normal(size=(mesh[0].shape[0], 2)),
+            surf_map=rng.standard_normal(
+                size=(mesh[0].shape[0], 2), dtype=np.float32
+            ),
             engine=engine
         )
 
 
-def test_plot_surf_avg_method_errors(rng):
-    mesh = generate_surf()
+def test_plot_surf_avg_method_errors(rng, surf_mesh):
+    mesh = surf_mesh
     with pytest.raises(
         ValueError,
         match=(
@@ -588,61 +539,77 @@ def test_plot_surf_avg_method_errors(rng):
                   )
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"colorbar": True},
+        {"alpha": 1},
+        # Change vmax
+        {"vmax": 5},
+        {"vmax": 5, "colorbar": True},
+        # Change colormap
+        {"cmap": "cubehelix"},
+        {"cmap": "cubehelix", "colorbar": True},
+    ],
+)
 @pytest.mark.parametrize("engine", ["matplotlib", "plotly"])
-def test_plot_surf_stat_map(engine, rng):
-    if not is_plotly_installed() and engine == "plotly":
+def test_plot_surf_stat_map(engine, kwargs, surf_mesh, surf_stat_map):
+    if not PLOTLY_INSTALLED and engine == "plotly":
         pytest.skip('Plotly is not installed; required for this test.')
-    mesh = generate_surf()
-    bg = rng.standard_normal(size=mesh[0].shape[0])
-    data = 10 * rng.standard_normal(size=mesh[0].shape[0])
-
-    # Plot mesh with stat map
-    plot_surf_stat_map(mesh, stat_map=data, engine=engine)
-    plot_surf_stat_map(mesh, stat_map=data, colorbar=True, engine=engine)
-    plot_surf_stat_map(mesh, stat_map=data, alpha=1, engine=engine)
-
-    # Plot mesh with background and stat map
-    plot_surf_stat_map(mesh, stat_map=data, bg_map=bg, engine=engine)
-    plot_surf_stat_map(mesh, stat_map=data, bg_map=bg,
-                       bg_on_data=True, darkness=0.5,
-                       engine=engine)
-    plot_surf_stat_map(mesh, stat_map=data, bg_map=bg, colorbar=True,
-                       bg_on_data=True, darkness=0.5, engine=engine)
-
-    # Plot with title
-    display = plot_surf_stat_map(mesh, stat_map=data, bg_map=bg,
-                                 title="Stat map title")
-    assert display.axes[0].title._text == "Stat map title"
-
-    # Apply threshold
-    plot_surf_stat_map(mesh, stat_map=data, bg_map=bg,
-                       bg_on_data=True, darkness=0.5,
-                       threshold=0.3, engine=engine)
-    plot_surf_stat_map(mesh, stat_map=data, bg_map=bg, colorbar=True,
-                       bg_on_data=True, darkness=0.5,
-                       threshold=0.3, engine=engine)
+    plot_surf_stat_map(
+        surf_mesh, stat_map=surf_stat_map, engine=engine, **kwargs
+    )
 
-    # Change colorbar tick format
-    plot_surf_stat_map(mesh, stat_map=data, bg_map=bg, colorbar=True,
-                       bg_on_data=True, darkness=0.5, cbar_tick_format="%.2g",
-                       engine=engine)
 
-    # Change vmax
-    plot_surf_stat_map(mesh, stat_map=data, vmax=5, engine=engine)
-    plot_surf_stat_map(mesh, stat_map=data, vmax=5,
-                       colorbar=True, engine=engine)
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"bg_on_data": True, "darkness": 0.5},
+        {"bg_on_data": True, "darkness": 0.5, "colorbar": True},
+        # Apply threshold
+        {"bg_on_data": True, "darkness": 0.5, "threshold": 0.3},
+        {
+            "bg_on_data": True,
+            "darkness": 0.5,
+            "threshold": 0.3,
+            "colorbar": True,
+        },
+        # Change colorbar tick format
+        {
+            "bg_on_data": True,
+            "darkness": 0.5,
+            "colorbar": True,
+            "cbar_tick_format": "%.2g",
+        },
+    ],
+)
+@pytest.mark.parametrize("engine", ["matplotlib", "plotly"])
+def test_plot_surf_stat_map_with_background(
+    engine, kwargs, surf_mesh, surf_bg, surf_stat_map
+):
+    if not PLOTLY_INSTALLED and engine == "plotly":
+        pytest.skip('Plotly is not installed; required for this test.')
+    plot_surf_stat_map(
+        surf_mesh,
+        stat_map=surf_stat_map,
+        bg_map=surf_bg,
+        engine=engine,
+        **kwargs,
+    )
 
-    # Change colormap
-    plot_surf_stat_map(mesh, stat_map=data, cmap='cubehelix', engine=engine)
-    plot_surf_stat_map(mesh, stat_map=data, cmap='cubehelix',
-                       colorbar=True, engine=engine)
 
-    plt.close()
+def test_plot_surf_stat_map_title(surf_mesh, surf_bg, surf_stat_map):
+    display = plot_surf_stat_map(surf_mesh, stat_map=surf_stat_map,
+                                 bg_map=surf_bg, title="Stat map title")
+    assert display.axes[0].title._text == "Stat map title"
 
 
-def test_plot_surf_stat_map_matplotlib_specific(rng):
-    mesh = generate_surf()
-    data = 10 * rng.standard_normal(size=mesh[0].shape[0])
+def test_plot_surf_stat_map_matplotlib_specific(surf_mesh, surf_stat_map):
+    mesh = surf_mesh
+    # copy as nan values are added to the texture below
+    data = surf_stat_map.copy()
     # Plot to axes
     axes = plt.subplots(ncols=2, subplot_kw={'projection': '3d'})[1]
     for ax in axes.flatten():
@@ -683,40 +650,55 @@ def test_plot_surf_stat_map_matplotlib_specific(rng):
     assert (mesh[1].shape[0] ==
             ((tmp._facecolors[:, 3]) != 0).sum())
 
-    # Save execution time and memory
-    plt.close()
 
+def test_plot_surf_stat_map_error(surf_mesh, surf_stat_map):
+    mesh, data = surf_mesh, surf_stat_map
 
-def test_plot_surf_stat_map_error(rng):
-    mesh = generate_surf()
-    data = 10 * rng.standard_normal(size=mesh[0].shape[0])
-
+    # Only the shapes matter here:
+    # use read-only broadcast views instead of stacked copies of the data
     # Wrong size of stat map data
     with pytest.raises(
             ValueError,
             match='surf_map does not have the same number of vertices'):
-        plot_surf_stat_map(mesh, stat_map=np.hstack((data, data)))
+        plot_surf_stat_map(
+            mesh, stat_map=np.broadcast_to(data[0], (2 * data.size,))
+        )
 
     with pytest.raises(
             ValueError,
             match="'surf_map' can only have one dimension"):
-        plot_surf_stat_map(mesh, stat_map=np.vstack((data, data)).T)
+        plot_surf_stat_map(
+            mesh, stat_map=np.broadcast_to(data[:, np.newaxis], (data.size, 2))
+        )
 
 
-def _generate_data_test_surf_roi():
-    mesh = generate_surf()
-    roi_idx = _rng().integers(0, mesh[0].shape[0], size=10)
-    roi_map = np.zeros(mesh[0].shape[0])
-    roi_map[roi_idx] = 1
-    parcellation = _rng().integers(100, size=mesh[0].shape[0]).astype(float)
-    return mesh, roi_map, parcellation
+def _generate_data_test_surf_roi(mesh):
+    rng = _rng()
+    n_vertices = mesh[0].shape[0]
+    roi_map = np.zeros(n_vertices)
+    np.put(roi_map, rng.integers(0, n_vertices, size=10), 1)
+    parcellation = rng.integers(100, size=n_vertices).astype(float)
+    return roi_map, parcellation
+
+
+@pytest.fixture(scope="session")
+def surf_roi_data(surf_mesh):
+    """Return read-only mesh, roi map and parcellation for ROI tests.
+
+    The maps are drawn once per session on the shared ``surf_mesh``.
+    Tests that modify the roi map or the parcellation must copy them.
+    """
+    roi_map, parcellation = _generate_data_test_surf_roi(surf_mesh)
+    for array in (roi_map, parcellation):
+        array.setflags(write=False)
+    return surf_mesh, roi_map, parcellation
 
 
 @pytest.mark.parametrize("engine", ["matplotlib", "plotly"])
-def test_plot_surf_roi(engine):
-    if not is_plotly_installed() and engine == "plotly":
+def test_plot_surf_roi(engine, surf_roi_data):
+    if not PLOTLY_INSTALLED and engine == "plotly":
         pytest.skip('Plotly is not installed; required for this test.')
-    mesh, roi_map, parcellation = _generate_data_test_surf_roi()
+    mesh, roi_map, parcellation = surf_roi_data
     # plot roi
     plot_surf_roi(mesh, roi_map=roi_map, engine=engine)
     plot_surf_roi(mesh, roi_map=roi_map,
@@ -727,11 +709,12 @@ def test_plot_surf_roi(engine):
                   engine=engine)
     plot_surf_roi(mesh, roi_map=parcellation, colorbar=True,
                   cbar_tick_format="%f", engine=engine)
-    plt.close()
 
 
-def test_plot_surf_roi_matplotlib_specific():
-    mesh, roi_map, parcellation = _generate_data_test_surf_roi()
+def test_plot_surf_roi_matplotlib_specific(surf_roi_data):
+    mesh, roi_map, parcellation = surf_roi_data
+    # copy as nan values are added to the parcellation below
+    parcellation = parcellation.copy()
 
     # change vmin, vmax
     img = plot_surf_roi(mesh, roi_map=roi_map, vmin=1.2,
@@ -766,13 +749,11 @@ def test_plot_surf_roi_matplotlib_specific():
         mesh[1].shape[0] ==
         ((tmp._facecolors[:, 3]) != 0).sum()
     )
-    # Save execution time and memory
-    plt.close()
 
 
-def test_plot_surf_roi_matplotlib_specific_plot_to_axes():
+def test_plot_surf_roi_matplotlib_specific_plot_to_axes(surf_roi_data):
     """Test plotting directly on some axes."""
-    mesh, roi_map, _ = _generate_data_test_surf_roi()
+    mesh, roi_map, _ = surf_roi_data
 
     plot_surf_roi(mesh, roi_map=roi_map, axes=None,
                   figure=plt.gcf(), engine='matplotlib')
@@ -789,15 +770,14 @@ def test_plot_surf_roi_matplotlib_specific_plot_to_axes():
                       figure=None, output_file=tmp_file.name,
                       colorbar=True, engine='matplotlib')
 
-    # Save execution time and memory
-    plt.close()
-
 
 @pytest.mark.parametrize("engine", ["matplotlib", "plotly"])
-def test_plot_surf_roi_error(engine, rng):
-    if not is_plotly_installed() and engine == "plotly":
+def test_plot_surf_roi_error(engine, rng, surf_roi_data):
+    if not PLOTLY_INSTALLED and engine == "plotly":
         pytest.skip('Plotly is not installed; required for this test.')
-    mesh, roi_map, _ = _generate_data_test_surf_roi()
+    mesh, roi_map, _ = surf_roi_data
+    # copy as the roi map is modified below
+    roi_map = roi_map.copy()
 
     # too many axes
     with pytest.raises(
@@ -813,31 +793,37 @@ def test_plot_surf_roi_error(engine, rng):
             match='roi_map does not have the same number of vertices'):
         plot_surf_roi(mesh, roi_map=roi_idx, engine=engine)
 
-    # negative value in roi map
-    roi_map[0] = -1
-    with pytest.warns(
-        DeprecationWarning,
-        match="Negative values in roi_map will no longer be allowed",
-    ):
-        plot_surf_roi(mesh, roi_map=roi_map, engine=engine)
-
-    # float value in roi map
-    roi_map[0] = 1.2
-    with pytest.warns(
-        DeprecationWarning,
-        match="Non-integer values in roi_map will no longer be allowed",
-    ):
-        plot_surf_roi(mesh, roi_map=roi_map, engine=engine)
-
-
-@pytest.mark.skipif(not is_plotly_installed(),
+    # The deprecation warnings are raised while checking roi_map,
+    # before plot_surf is called: skip the rendering
+    with mock.patch(
+        "nilearn.plotting.surf_plotting.plot_surf"
+    ) as mock_plot_surf:
+        # negative value in roi map
+        roi_map[0] = -1
+        with pytest.warns(
+            DeprecationWarning,
+            match="Negative values in roi_map will no longer be allowed",
+        ):
+            plot_surf_roi(mesh, roi_map=roi_map, engine=engine)
+
+        # float value in roi map
+        roi_map[0] = 1.2
+        with pytest.warns(
+            DeprecationWarning,
+            match="Non-integer values in roi_map will no longer be allowed",
+        ):
+            plot_surf_roi(mesh, roi_map=roi_map, engine=engine)
+    assert mock_plot_surf.call_count == 2
+
+
+@pytest.mark.skipif(not PLOTLY_INSTALLED,
                     reason=("This test only runs if Plotly is installed."))
 @pytest.mark.parametrize(
     "kwargs", [{"vmin": 2}, {"vmin": 2, "threshold": 5}, {"threshold": 5}]
 )
-def test_plot_surf_roi_colorbar_vmin_equal_across_engines(kwargs):
+def test_plot_surf_roi_colorbar_vmin_equal_across_engines(kwargs, surf_mesh):
     """See issue https://github.com/nilearn/nilearn/issues/3944."""
-    mesh = generate_surf()
+    mesh = surf_mesh
     roi_map = np.arange(0, len(mesh[0]))
 
     mpl_plot = plot_surf_roi(
@@ -851,36 +837,108 @@ def test_plot_surf_roi_colorbar_vmin_equal_across_engines(kwargs):
     )
 
 
-def test_plot_img_on_surf_hemispheres_and_orientations(img_3d_mni):
-    nii = img_3d_mni
-    # Check that all combinations of 1D or 2D hemis and orientations work.
-    plot_img_on_surf(nii, hemispheres=['right'], views=['lateral'])
-    plot_img_on_surf(nii, hemispheres=['left', 'right'], views=['lateral'])
-    plot_img_on_surf(nii,
-                     hemispheres=['right'],
-                     views=['medial', 'lateral'])
-    plot_img_on_surf(nii,
-                     hemispheres=['left', 'right'],
-                     views=['dorsal', 'medial'])
-    # Check that manually set view angles work.
-    plot_img_on_surf(nii,
-                     hemispheres=['left', 'right'],
-                     views=[(210.0, 90.0), (15.0, -45.0)])
-
-
-def test_plot_img_on_surf_colorbar(img_3d_mni):
-    nii = img_3d_mni
-    plot_img_on_surf(nii, hemispheres=['right'], views=['lateral'],
-                     colorbar=True, vmin=-5, vmax=5, threshold=3)
-    plot_img_on_surf(nii, hemispheres=['right'], views=['lateral'],
-                     colorbar=True, vmin=-1, vmax=5, symmetric_cbar=False,
-                     threshold=3)
-    plot_img_on_surf(nii, hemispheres=['right'], views=['lateral'],
-                     colorbar=False)
-    plot_img_on_surf(nii, hemispheres=['right'], views=['lateral'],
-                     colorbar=False, cmap='roy_big_bl')
-    plot_img_on_surf(nii, hemispheres=['right'], views=['lateral'],
-                     colorbar=True, cmap='roy_big_bl', vmax=2)
+@pytest.fixture(scope="session")
+def img_3d_mni():
+    """Return a read-only random 3D Nifti1Image in MNI space.
+
+    Overrides the function-scoped fixture of nilearn/conftest.py so that
+    the image is only built once for the many plot_img_on_surf tests,
+    none of which modify it.
+    """
+    img = _img_3d_mni()
+    img.dataobj.setflags(write=False)
+    # load the data now so that later calls to get_fdata hit the cache
+    img.get_fdata()
+    return img
+
+
+@pytest.fixture(scope="session")
+def fsaverage5():
+    """Fetch fsaverage5 once per session."""
+    return fetch_surf_fsaverage()
+
+
+@pytest.fixture(scope="session")
+def fsaverage5_left_mesh(fsaverage5):
+    """Return read-only coordinates, faces and curvature sign \
+    of the left fsaverage5 pial mesh."""
+    coords, faces = load_surf_mesh(fsaverage5['pial_left'])
+    # Surface map whose value in each vertex is
+    # 1 if this vertex's curv > 0
+    # 0 if this vertex's curv is 0
+    # -1 if this vertex's curv < 0
+    curv_sign = np.sign(load_surf_data(fsaverage5['curv_left']))
+    for array in (coords, faces, curv_sign):
+        array.setflags(write=False)
+    return coords, faces, curv_sign
+
+
+@pytest.mark.parametrize(
+    "hemispheres,views",
+    [
+        # Check that all combinations of 1D or 2D hemis and orientations work.
+        (['right'], ['lateral']),
+        (['left', 'right'], ['lateral']),
+        (['right'], ['medial', 'lateral']),
+        (['left', 'right'], ['dorsal', 'medial']),
+        # Check that manually set view angles work.
+        (['left', 'right'], [(210.0, 90.0), (15.0, -45.0)]),
+    ],
+)
+def test_plot_img_on_surf_hemispheres_and_orientations(
+    img_3d_mni, hemispheres, views
+):
+    plot_img_on_surf(img_3d_mni, hemispheres=hemispheres, views=views)
+
+
+@pytest.fixture(scope="module")
+def vol_to_surf_cache():
+    """Return a dictionary storing textures projected in this module."""
+    return {}
+
+
+@pytest.fixture()
+def cached_vol_to_surf(monkeypatch, vol_to_surf_cache):
+    """Reuse the volume to surface projections across the tests \
+    of this module.
+
+    Projecting the volume is the most expensive step of plot_img_on_surf
+    and gives the same texture as long as the image and mesh are the same.
+    """
+    def _cached_vol_to_surf(img, surf_mesh, mask_img=None, **kwargs):
+        if mask_img is not None or kwargs or not isinstance(surf_mesh, str):
+            return vol_to_surf(img, surf_mesh, mask_img=mask_img, **kwargs)
+        key = (surf_mesh, get_data(img).tobytes(), img.affine.tobytes())
+        if key not in vol_to_surf_cache:
+            vol_to_surf_cache[key] = vol_to_surf(img, surf_mesh)
+        # copy so that plotting can never alter the cached texture
+        return vol_to_surf_cache[key].copy()
+
+    monkeypatch.setattr(
+        "nilearn.plotting.surf_plotting.vol_to_surf", _cached_vol_to_surf
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"colorbar": True, "vmin": -5, "vmax": 5, "threshold": 3},
+        {
+            "colorbar": True,
+            "vmin": -1,
+            "vmax": 5,
+            "symmetric_cbar": False,
+            "threshold": 3,
+        },
+        {"colorbar": False},
+        {"colorbar": False, "cmap": "roy_big_bl"},
+        {"colorbar": True, "cmap": "roy_big_bl", "vmax": 2},
+    ],
+)
+def test_plot_img_on_surf_colorbar(img_3d_mni, kwargs, cached_vol_to_surf):
+    plot_img_on_surf(
+        img_3d_mni, hemispheres=['right'], views=['lateral'], **kwargs
+    )
 
 
 def test_plot_img_on_surf_inflate(img_3d_mni):
@@ -889,40 +947,61 @@ def test_plot_img_on_surf_inflate(img_3d_mni):
                      inflate=True)
 
 
-def test_plot_img_on_surf_surf_mesh(img_3d_mni):
-    nii = img_3d_mni
-    plot_img_on_surf(nii, hemispheres=['right', 'left'], views=['lateral'])
-    plot_img_on_surf(nii, hemispheres=['right', 'left'], views=['lateral'],
-                     surf_mesh='fsaverage5')
-    surf_mesh = fetch_surf_fsaverage()
-    plot_img_on_surf(nii, hemispheres=['right', 'left'], views=['lateral'],
-                     surf_mesh=surf_mesh)
+def test_plot_img_on_surf_surf_mesh(img_3d_mni, fsaverage5):
+    # The default surf_mesh is 'fsaverage5': check the string
+    # and the already fetched mesh
+    for surf_mesh in ['fsaverage5', fsaverage5]:
+        plot_img_on_surf(img_3d_mni, hemispheres=['right', 'left'],
+                         views=['lateral'], surf_mesh=surf_mesh)
+        plt.close("all")
+
+
+@pytest.fixture()
+def fail_if_mesh_loaded(monkeypatch):
+    """Make plot_img_on_surf fail if it fetches a mesh \
+    or projects the image.
+
+    Use for tests checking that invalid arguments are rejected
+    before any expensive work is done.
+    """
+    def fail(*args, **kwargs):
+        raise AssertionError(
+            "Arguments should be validated before loading the mesh "
+            "or projecting the image."
+        )
 
+    monkeypatch.setattr("nilearn.plotting.surf_plotting.check_mesh", fail)
+    monkeypatch.setattr("nilearn.plotting.surf_plotting.vol_to_surf", fail)
 
-def test_plot_img_on_surf_with_invalid_orientation(img_3d_mni):
+
+def test_plot_img_on_surf_with_invalid_orientation(
+    img_3d_mni, fail_if_mesh_loaded
+):
     kwargs = {"hemisphere": ["right"], "inflate": True}
     nii = img_3d_mni
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Invalid view definition"):
         plot_img_on_surf(nii, views=['latral'], **kwargs)
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Invalid view definition"):
         plot_img_on_surf(nii, views=['dorsal', 'post'], **kwargs)
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="not iterable"):
         plot_img_on_surf(nii, views=0, **kwargs)
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Invalid view definition"):
         plot_img_on_surf(nii, views=['medial', {'a': 'a'}], **kwargs)
 
 
-def test_plot_img_on_surf_with_invalid_hemisphere(img_3d_mni):
+def test_plot_img_on_surf_with_invalid_hemisphere(
+    img_3d_mni, fail_if_mesh_loaded
+):
     nii = img_3d_mni
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Invalid hemispheres definition"):
         plot_img_on_surf(
             nii, views=['lateral'], inflate=True, hemispheres=["lft]"]
         )
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Invalid hemispheres definition"):
         plot_img_on_surf(
             nii, views=['medial'], inflate=True, hemispheres=['lef']
         )
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Invalid hemispheres definition"):
         plot_img_on_surf(
             nii,
             views=['anterior', 'posterior'],
@@ -931,9 +1010,11 @@ def test_plot_img_on_surf_with_invalid_hemisphere(img_3d_mni):
         )
 
 
-def test_plot_img_on_surf_with_figure_kwarg(img_3d_mni):
+def test_plot_img_on_surf_with_figure_kwarg(img_3d_mni, fail_if_mesh_loaded):
     nii = img_3d_mni
-    with pytest.raises(ValueError):
+    with pytest.raises(
+        ValueError, match="plot_img_on_surf does not accept figure"
+    ):
         plot_img_on_surf(
             nii,
             views=["anterior"],
@@ -942,9 +1023,11 @@ def test_plot_img_on_surf_with_figure_kwarg(img_3d_mni):
         )
 
 
-def test_plot_img_on_surf_with_axes_kwarg(img_3d_mni):
+def test_plot_img_on_surf_with_axes_kwarg(img_3d_mni, fail_if_mesh_loaded):
     nii = img_3d_mni
-    with pytest.raises(ValueError):
+    with pytest.raises(
+        ValueError, match="plot_img_on_surf does not accept axes"
+    ):
         plot_img_on_surf(
             nii,
             views=["anterior"],
@@ -954,8 +1037,10 @@ def test_plot_img_on_surf_with_axes_kwarg(img_3d_mni):
         )
 
 
-def test_plot_img_on_surf_with_engine_kwarg(img_3d_mni):
-    with pytest.raises(ValueError):
+def test_plot_img_on_surf_with_engine_kwarg(img_3d_mni, fail_if_mesh_loaded):
+    with pytest.raises(
+        ValueError, match="plot_img_on_surf does not accept engine"
+    ):
         plot_img_on_surf(
             img_3d_mni,
             views=["anterior"],
@@ -978,41 +1063,53 @@ def test_plot_img_on_surf_title(img_3d_mni):
     assert fig._suptitle.get_text() == title, "Title text not assigned."
 
 
-def test_plot_img_on_surf_output_file(tmp_path, img_3d_mni):
-    nii = img_3d_mni
-    fname = tmp_path / 'tmp.png'
-    return_value = plot_img_on_surf(nii,
-                                    hemispheres=['right'],
-                                    views=['lateral'],
-                                    output_file=str(fname))
+def test_plot_img_on_surf_output_file(img_3d_mni):
+    # Save in memory at low resolution to keep encoding cheap
+    buffer = io.BytesIO()
+    with mpl.rc_context({"savefig.dpi": 50}):
+        return_value = plot_img_on_surf(img_3d_mni,
+                                        hemispheres=['right'],
+                                        views=['lateral'],
+                                        output_file=buffer)
     assert return_value is None, "Returned figure and axes on file output."
-    assert fname.is_file(), "Saved image file could not be found."
+    assert buffer.getbuffer().nbytes > 0, "No image was saved."
 
 
-def test_plot_surf_contours():
-    mesh = generate_surf()
-    # we need a valid parcellation for testing
-    parcellation = np.zeros((mesh[0].shape[0],))
-    parcellation[mesh[1][3]] = 1
-    parcellation[mesh[1][5]] = 2
+@pytest.fixture(scope="session")
+def surf_parcellation(surf_mesh):
+    """Return a read-only valid parcellation of ``surf_mesh`` \
+    for contour tests."""
+    parcellation = np.zeros((surf_mesh[0].shape[0],))
+    parcellation[surf_mesh[1][3]] = 1
+    parcellation[surf_mesh[1][5]] = 2
+    parcellation.setflags(write=False)
+    return parcellation
+
+
+def test_plot_surf_contours(surf_mesh, surf_parcellation):
+    mesh, parcellation = surf_mesh, surf_parcellation
     plot_surf_contours(mesh, parcellation)
-    plot_surf_contours(mesh, parcellation, levels=[1, 2])
-    plot_surf_contours(mesh, parcellation, levels=[1, 2], cmap='gist_ncar')
-    plot_surf_contours(mesh, parcellation, levels=[1, 2],
-                       colors=['r', 'g'])
-    plot_surf_contours(mesh, parcellation, levels=[1, 2], colors=['r', 'g'],
-                       labels=['1', '2'])
-    fig = plot_surf_contours(mesh, parcellation, levels=[1, 2],
-                             colors=['r', 'g'],
-                             labels=['1', '2'], legend=True)
-    assert fig.legends is not None
-    plot_surf_contours(mesh, parcellation, levels=[1, 2],
-                       colors=[[0, 0, 0, 1], [1, 1, 1, 1]])
     fig, axes = plt.subplots(1, 1, subplot_kw={'projection': '3d'})
     plot_surf_contours(mesh, parcellation, axes=axes)
     plot_surf_contours(mesh, parcellation, figure=fig)
+
+    # Contours are drawn by recoloring the faces of a surface
+    # already plotted on the axes:
+    # plot the surface once and reuse it to check the styling options.
     fig = plot_surf(mesh)
-    plot_surf_contours(mesh, parcellation, figure=fig)
+    for kwargs in [
+        {},
+        {"levels": [1, 2]},
+        {"levels": [1, 2], "cmap": 'gist_ncar'},
+        {"levels": [1, 2], "colors": ['r', 'g']},
+        {"levels": [1, 2], "colors": ['r', 'g'], "labels": ['1', '2']},
+        {"levels": [1, 2], "colors": [[0, 0, 0, 1], [1, 1, 1, 1]]},
+    ]:
+        plot_surf_contours(mesh, parcellation, figure=fig, **kwargs)
+    fig = plot_surf_contours(mesh, parcellation, levels=[1, 2],
+                             colors=['r', 'g'],
+                             labels=['1', '2'], legend=True, figure=fig)
+    assert fig.legends is not None
     display = plot_surf_contours(mesh, parcellation, levels=[1, 2],
                                  labels=['1', '2'], colors=['r', 'g'],
                                  legend=True, title='title',
@@ -1020,6 +1117,7 @@ def test_plot_surf_contours():
     # Non-regression assertion: we switched from _suptitle to axis title
     assert display._suptitle is None
     assert display.axes[0].get_title() == "title"
+
     fig = plot_surf(mesh, title='title 2')
     display = plot_surf_contours(mesh, parcellation, levels=[1, 2],
                                  labels=['1', '2'], colors=['r', 'g'],
@@ -1029,16 +1127,22 @@ def test_plot_surf_contours():
     assert display.axes[0].get_title() == "title 2"
     with tempfile.NamedTemporaryFile() as tmp_file:
         plot_surf_contours(mesh, parcellation, output_file=tmp_file.name)
-    plt.close()
 
 
-def test_plot_surf_contours_error(rng):
-    mesh = generate_surf()
-    # we need an invalid parcellation for testing
-    invalid_parcellation = rng.uniform(size=(mesh[0].shape[0]))
-    parcellation = np.zeros((mesh[0].shape[0],))
-    parcellation[mesh[1][3]] = 1
-    parcellation[mesh[1][5]] = 2
+@pytest.fixture(scope="session")
+def invalid_surf_parcellation(surf_mesh):
+    """Return a read-only parcellation of ``surf_mesh`` \
+    whose vertices do not form regions."""
+    invalid_parcellation = _rng().uniform(size=(surf_mesh[0].shape[0]))
+    invalid_parcellation.setflags(write=False)
+    return invalid_parcellation
+
+
+def test_plot_surf_contours_error(
+    surf_mesh, surf_parcellation, invalid_surf_parcellation
+):
+    mesh, parcellation = surf_mesh, surf_parcellation
+    invalid_parcellation = invalid_surf_parcellation
     with pytest.raises(
             ValueError,
             match='Vertices in parcellation do not form region.'):
@@ -1069,7 +1173,8 @@ def test_plot_surf_contours_error(rng):
             labels=['1', '2'])
 
 
-@pytest.mark.parametrize("vmin,vmax,cbar_tick_format,expected", [
+# vmin, vmax, cbar_tick_format, expected ticks
+EXPECTED_TICKS_MATPLOTLIB = [
     (0, 0, "%i", [0]),
     (0, 3, "%i", [0, 1, 2, 3]),
     (0, 4, "%i", [0, 1, 2, 3, 4]),
@@ -1081,26 +1186,24 @@ def test_plot_surf_contours_error(rng):
     (1, 2, "%.1f", [1, 1.25, 1.5, 1.75, 2]),
     (1.1, 1.2, "%.1f", [1.1, 1.125, 1.15, 1.175, 1.2]),
     (0, np.nextafter(0, 1), "%.1f", [0.e+000, 5.e-324]),
-])
-def test_get_ticks_matplotlib(vmin, vmax, cbar_tick_format, expected):
-    ticks = _get_ticks_matplotlib(vmin, vmax, cbar_tick_format, threshold=None)
-    assert 1 <= len(ticks) <= 5
-    assert ticks[0] == vmin and ticks[-1] == vmax
-    assert (
-        len(np.unique(ticks)) == len(expected)
-        and (np.unique(ticks) == expected).all()
-    )
+]
 
 
-def test_compute_facecolors_matplotlib():
-    fsaverage = fetch_surf_fsaverage()
-    mesh = load_surf_mesh(fsaverage['pial_left'])
+def test_get_ticks_matplotlib():
+    # Pure numeric helper: check all cases in one test
+    for vmin, vmax, cbar_tick_format, expected in EXPECTED_TICKS_MATPLOTLIB:
+        ticks = _get_ticks_matplotlib(
+            vmin, vmax, cbar_tick_format, threshold=None
+        )
+        assert 1 <= len(ticks) <= 5
+        assert ticks[0] == vmin and ticks[-1] == vmax
+        assert_array_equal(np.unique(ticks), expected)
+
+
+def test_compute_facecolors_matplotlib(fsaverage5_left_mesh):
+    coords, faces, bg_map = fsaverage5_left_mesh
+    mesh = (coords, faces)
     alpha = "auto"
-    # Surface map whose value in each vertex is
-    # 1 if this vertex's curv > 0
-    # 0 if this vertex's curv is 0
-    # -1 if this vertex's curv < 0
-    bg_map = np.sign(load_surf_data(fsaverage['curv_left']))
     bg_min, bg_max = np.min(bg_map), np.max(bg_map)
     assert (bg_min < 0 or bg_max > 1)
     facecolors_auto_normalized = _compute_facecolors_matplotlib(
@@ -1158,17 +1261,18 @@ def test_compute_facecolors_matplotlib():
         )
 
 
-@pytest.mark.skipif(not is_plotly_installed(),
+@pytest.mark.skipif(not PLOTLY_INSTALLED,
                     reason=("This test only runs if Plotly is installed."))
-@pytest.mark.parametrize("avg_method", ["mean", "median"])
-@pytest.mark.parametrize("symmetric_cmap", [True, False, None])
-@pytest.mark.parametrize("engine", ["matplotlib", "plotly"])
-def test_plot_surf_roi_default_arguments(engine, symmetric_cmap, avg_method):
+def test_plot_surf_roi_default_arguments(surf_roi_data):
     """Regression test for https://github.com/nilearn/nilearn/issues/3941."""
-    mesh, roi_map, _ = _generate_data_test_surf_roi()
-    plot_surf_roi(mesh, roi_map=roi_map,
-                  engine=engine,
-                  symmetric_cmap=symmetric_cmap,
-                  darkness=None,  # to avoid deprecation warning
-                  cmap="RdYlBu_r",
-                  avg_method=avg_method)
+    mesh, roi_map, _ = surf_roi_data
+    for engine, symmetric_cmap, avg_method in itertools.product(
+        ["matplotlib", "plotly"], [True, False, None], ["mean", "median"]
+    ):
+        plot_surf_roi(mesh, roi_map=roi_map,
+                      engine=engine,
+                      symmetric_cmap=symmetric_cmap,
+                      darkness=None,  # to avoid deprecation warning
+                      cmap="RdYlBu_r",
+                      avg_method=avg_method)
+        plt.close("all")